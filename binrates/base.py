@@ -5,18 +5,60 @@ stellar evolutionary code and random binary populations following certain
 P.D.F.s
 """
 
+import hashlib
 import logging
+import os
+
+import numpy as np
 
 from binrates.io.logger import set_logger
-from binrates.io.utils import load_config
+from binrates.io.utils import load_config, safe_makedirs
 from binrates.population import Population, TargetRegion
 
 
 logger = logging.getLogger(__name__)
 
+# memoized populations keyed by (number, seed, frozen config); only
+# seeded populations are cached, unseeded draws must stay random
+_POPULATION_CACHE = {}
+_POPULATION_CACHE_MAXSIZE = 8
+
+
+def _freeze_config(value):
+    """Recursively turn a config mapping into a hashable cache key"""
+
+    if isinstance(value, dict):
+        return tuple((k, _freeze_config(v)) for k, v in sorted(value.items()))
+    if isinstance(value, list):
+        return tuple(_freeze_config(v) for v in value)
+    return value
+
+
+def _population_cache_path(key):
+    """Location of the on-disk population cache for the given key"""
+
+    digest = hashlib.sha1(repr(key).encode()).hexdigest()[:16]
+    cache_dir = os.path.join(
+        os.environ.get(
+            "XDG_CACHE_HOME",
+            os.path.join(os.path.expanduser("~"), ".cache"),
+        ),
+        "binrates",
+    )
+    return os.path.join(cache_dir, "pop-{}.npy".format(digest))
+
 
 def init_random_binaries(BinPopConfig):
-    """Function to initialize binary populations"""
+    """Function to initialize binary populations
+
+    Seeded populations are always sampled from the seeded NumPy
+    Generator stream (the parallel JIT sampler only handles unseeded
+    draws), so the same (number, seed, config) reproduces the same
+    arrays on any install, with or without Numba. That makes the key a
+    valid identity for the in-memory memo and the cross-process .npy
+    cache in the binrates cache directory. Unseeded populations are
+    always drawn fresh.
+    """
 
     msg = "instantiating Population object for random population from "
     msg += "probability density functions"
@@ -26,8 +68,36 @@ def init_random_binaries(BinPopConfig):
     number = BinPopConfig["number"]
     seed = BinPopConfig["seed"]
 
-    # define the random binary pop.
-    BinPop = Population(number=number, seed=seed, Config=BinPopConfig)
+    if seed is None:
+        return Population(number=number, seed=seed, Config=BinPopConfig)
+
+    key = (number, seed, _freeze_config(BinPopConfig))
+
+    BinPop = _POPULATION_CACHE.get(key)
+    if BinPop is not None:
+        logger.debug("reusing memoized population for identical config")
+        return BinPop
+
+    cache_path = _population_cache_path(key)
+    if os.path.exists(cache_path):
+        try:
+            BinPop = Population.from_array(np.load(cache_path), number, seed)
+            logger.debug("loaded cached population from `%s`", cache_path)
+        except (OSError, ValueError):
+            BinPop = None
+
+    if BinPop is None:
+        # define the random binary pop.
+        BinPop = Population(number=number, seed=seed, Config=BinPopConfig)
+        try:
+            safe_makedirs(os.path.dirname(cache_path))
+            np.save(cache_path, BinPop.population_array)
+        except OSError:
+            logger.debug("could not write population cache to disk")
+
+    if len(_POPULATION_CACHE) >= _POPULATION_CACHE_MAXSIZE:
+        _POPULATION_CACHE.pop(next(iter(_POPULATION_CACHE)))
+    _POPULATION_CACHE[key] = BinPop
 
     return BinPop
 
@@ -74,7 +144,7 @@ def eval_rates(config_fname: str = "", log_level: str = None, **kwargs):
     # create binary population
     logger.info("initializing random binary population")
     BinPop = init_random_binaries(Config["BinaryPopulation"])
-    logger.info(f"Population succesfully computed in `{BinPop}`")
+    logger.info("Population succesfully computed in `%s`", BinPop)
 
     # now get region of binary parameter space to which rates will be eval
     logger.info("loading target region of binary parameter space")
@@ -1,9 +1,16 @@
+import atexit
 import getpass
 import logging
-import logging.config
 import os
+import queue
 import sys
 import tempfile
+from logging.handlers import (
+    MemoryHandler,
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+)
 
 from .utils import safe_makedirs
 
@@ -33,61 +40,76 @@ else:
         tempfile.gettempdir(), "bin2dcomngr-{}.log".format(getpass.getuser())
     )
 
-LOGGING_CFG = {
-    "version": 1,
-    "disable_existing_loggers": "False",
-    "root": {"level": "INFO", "handlers": ["file", "console"]},
-    "formatters": {
-        "standard": {"format": "%(asctime)s -- %(levelname)s -- %(message)s"},
-        "short": {"format": "%(levelname)s -- %(message)s"},
-        "long": {
-            "format": "%(asctime)s -- %(levelname)s -- %(message)s (%(funcName)s in %(filename)s)"
-        },
-        "free": {"format": "%(message)s"},
-    },
-    "handlers": {
-        "file": {
-            "level": "DEBUG",
-            "class": "logging.handlers.RotatingFileHandler",
-            "maxBytes": 1000000,
-            "backupCount": 3,
-            "formatter": "standard",
-            "filename": LOG_FILENAME,
-        },
-        "console": {
-            "level": "CRITICAL",
-            "class": "logging.StreamHandler",
-            "formatter": "free",
-        },
-    },
-    "loggers": {
-        "debug": {"handlers": ["file", "console"], "level": "DEBUG"},
-        "verbose": {"handlers": ["file", "console"], "level": "INFO"},
-        "standard": {"handlers": ["file"], "level": "INFO"},
-        "requests": {"handlers": ["file", "console"], "level": "ERROR"},
-        "elasticsearch": {"handlers": ["file", "console"], "level": "ERROR"},
-        "elasticsearch.trace": {
-            "handlers": ["file", "console"],
-            "level": "ERROR",
-        },
-    },
-}
+# formats used by the different handlers
+STANDARD_FORMAT = "%(asctime)s -- %(levelname)s -- %(message)s"
+SHORT_FORMAT = "%(levelname)s -- %(message)s"
+LONG_FORMAT = (
+    "%(asctime)s -- %(levelname)s -- %(message)s "
+    "(%(funcName)s in %(filename)s)"
+)
+FREE_FORMAT = "%(message)s"
+
+# background listener thread doing the actual formatting and I/O
+_LISTENER = None
 
 
 def set_logger():
     """build and return a logger
 
+    Log records are funnelled through a queue.SimpleQueue so logging
+    calls on hot paths only enqueue the record; a background
+    QueueListener thread performs the formatting and the (blocking)
+    file and console writes.
+
     Returns
     -------
     logger : `Logger instance`
     """
 
+    global _LISTENER
+
     _logger = logging.getLogger()
 
-    config = LOGGING_CFG
+    if _LISTENER is not None:
+        return _logger
+
+    # a reloaded module or a repeated configuration must not stack queue
+    # handlers on the root logger: every duplicate multiplies the I/O
+    # performed for each record
+    for handler in list(_logger.handlers):
+        if isinstance(handler, QueueHandler):
+            _logger.removeHandler(handler)
+
+    file_handler = RotatingFileHandler(
+        LOG_FILENAME, maxBytes=1000000, backupCount=3
+    )
+    file_handler.setFormatter(logging.Formatter(STANDARD_FORMAT))
 
-    # Load the configuration
-    logging.config.dictConfig(config)
+    # buffer file records in memory and flush them in batches (or right
+    # away on ERROR), turning per-record writes into one write per 1024
+    # records on chatty debug runs
+    memory_handler = MemoryHandler(
+        capacity=1024, flushLevel=logging.ERROR, target=file_handler
+    )
+    memory_handler.setLevel(logging.DEBUG)
+    atexit.register(memory_handler.flush)
+
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(logging.CRITICAL)
+    console_handler.setFormatter(logging.Formatter(FREE_FORMAT))
+
+    log_queue = queue.SimpleQueue()
+    _logger.setLevel(logging.INFO)
+    _logger.addHandler(QueueHandler(log_queue))
+
+    _LISTENER = QueueListener(
+        log_queue,
+        memory_handler,
+        console_handler,
+        respect_handler_level=True,
+    )
+    _LISTENER.start()
+    atexit.register(_LISTENER.stop)
 
     return _logger
 
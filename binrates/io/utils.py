@@ -1,13 +1,20 @@
 """Module to load YAML configuration files"""
 
+import copy
 import errno
+import json
 import logging
 import os
-
-import yaml
+import tempfile
+from collections import OrderedDict
 
 logger = logging.getLogger(__name__)
 
+# LRU cache of parsed configs keyed by absolute path; each entry stores
+# (st_mtime_ns, st_size, parsed dict) so edits to the file invalidate it
+_CONFIG_CACHE = OrderedDict()
+_CONFIG_CACHE_MAXSIZE = 100
+
 
 def safe_makedirs(path: str) -> None:
     """A safe function for creating a directory tree."""
@@ -21,9 +28,50 @@ def safe_makedirs(path: str) -> None:
             raise
 
 
+def _sidecar_enabled() -> bool:
+    """Whether the JSON sidecar cache is turned on via environment"""
+    return os.environ.get("BINRATES_YAML_CACHE", "") == "1"
+
+
+def _load_sidecar(fname):
+    """Return the parsed sidecar cache of `fname` if it is fresh, else None
+
+    The sidecar is a `<fname>.cache.json` file written by a previous
+    `load_config` call; it is only used when its mtime is at least as
+    recent as the YAML file itself (json.load is C-implemented and much
+    faster than parsing YAML).
+    """
+    cache_path = fname + ".cache.json"
+    try:
+        if os.path.getmtime(cache_path) >= os.path.getmtime(fname):
+            with open(cache_path, "r") as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _write_sidecar(fname, config) -> None:
+    """Atomically dump `config` to the JSON sidecar next to `fname`"""
+    cache_path = fname + ".cache.json"
+    try:
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(fname)), suffix=".tmp"
+        )
+        with os.fdopen(fd, "w") as f:
+            json.dump(config, f)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError):
+        logger.debug("could not write JSON sidecar for `%s`", fname)
+
+
 def load_config(fname):
     """Load configuration file with YAML format
 
+    Parsed configs are cached in memory keyed by (path, mtime, size) so
+    repeated calls for an unchanged file skip the YAML parser. A deepcopy
+    is returned because callers mutate the configuration downstream.
+
     Parameters
     ----------
     fname
@@ -31,5 +79,40 @@ def load_config(fname):
     Returns
     -------
     """
-    with open(fname, "r") as f:
-        return yaml.load(f, Loader=yaml.FullLoader)
+
+    key = os.path.abspath(fname)
+    st = os.stat(fname)
+
+    cached = _CONFIG_CACHE.get(key)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        logger.debug("returning cached config for `%s`", key)
+        _CONFIG_CACHE.move_to_end(key)
+        return copy.deepcopy(cached[2])
+
+    config = None
+    if _sidecar_enabled():
+        config = _load_sidecar(fname)
+
+    if config is None:
+        # deferred so `import binrates` does not pay the yaml import;
+        # after the first call this is a cached sys.modules lookup
+        import yaml
+
+        try:
+            # LibYAML-backed loader (C), typically 2-10x faster than the
+            # pure-Python one. Configs are plain scalars & mappings so
+            # the safe loader is enough
+            from yaml import CSafeLoader as Loader
+        except ImportError:
+            from yaml import SafeLoader as Loader
+
+        with open(fname, "r") as f:
+            config = yaml.load(f, Loader=Loader)
+        if _sidecar_enabled():
+            _write_sidecar(fname, config)
+
+    _CONFIG_CACHE[key] = (st.st_mtime_ns, st.st_size, config)
+    if len(_CONFIG_CACHE) > _CONFIG_CACHE_MAXSIZE:
+        _CONFIG_CACHE.popitem(last=False)
+
+    return copy.deepcopy(config)
@@ -30,12 +30,21 @@ class Population(object):
 
     Config : `dictionary`
         Dictionary with configs for the PDFs of initial binary conditions.
+
+    dtype : `np.dtype`
+        Floating point type of the population arrays. Default is
+        np.float64; np.float32 halves the memory footprint and bandwidth
+        of downstream vectorized scans when single precision is enough.
     """
 
     DEFAULT_BINARIESNO = 100000
 
     def __init__(
-        self, number: float = 0, seed: int = None, Config: dict = None
+        self,
+        number: float = 0,
+        seed: int = None,
+        Config: dict = None,
+        dtype=np.float64,
     ):
 
         logger.debug("generating binary population")
@@ -77,41 +86,69 @@ class Population(object):
             },
         }
 
+        # merge the user config over the defaults, skipping unset values
         for key, value in Config.items():
+            if key in args and isinstance(value, dict):
+                args[key].update(
+                    {k: v for k, v in value.items() if v is not None}
+                )
 
-            if key == "Primary":
-                for subkey, subval in Config[key].items():
-                    if subkey in Config[key]:
-                        if subval is not None:
-                            args[key][subkey] = subval
-
-            if key == "MassRatio":
-                for subkey, subval in Config[key].items():
-                    if subkey in Config[key]:
-                        if subval is not None:
-                            args[key][subkey] = subval
-
-            if key == "OrbitalPeriod":
-                for subkey, subval in Config[key].items():
-                    if subkey in Config[key]:
-                        if subval is not None:
-                            args[key][subkey] = subval
-
-        logger.debug(f"Arguments to use: `{args}`")
+        # deferred %-formatting plus an explicit gate: the dict repr is
+        # only built when a handler actually accepts DEBUG records
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Arguments to use: `%s`", args)
 
         # for reproduction of results
         if self.seed is not None:
             set_seed(self.seed)
 
-        self.primaries = self.generate_primaries(args["Primary"])
-        self.mass_ratios = self.generate_companions(args["MassRatio"])
-        self.periods = self.generate_periods(args["OrbitalPeriod"])
+        # single C-contiguous (N, 3) array holding the whole population;
+        # the samplers fill its columns in place and the per-parameter
+        # attributes are views into it (no vstack/transpose copies, and
+        # row access is stride-1 for downstream vectorized kernels)
+        self.population_array = np.empty((self.number, 3), dtype=dtype)
+
+        self.primaries = self.generate_primaries(
+            args["Primary"], out=self.population_array[:, 0]
+        )
+        self.mass_ratios = self.generate_companions(
+            args["MassRatio"], out=self.population_array[:, 1]
+        )
+        self.periods = self.generate_periods(
+            args["OrbitalPeriod"], out=self.population_array[:, 2]
+        )
+
+    @classmethod
+    def from_array(cls, population_array, number: int, seed: int = None):
+        """Rebuild a Population from a previously generated (N, 3) array
+
+        Used by the population cache in `base` to skip the sampling step
+        when an identical (seeded) population was generated before.
+
+        Parameters
+        ----------
+        population_array : `np.ndarray`
+            Array of shape (N, 3) with primaries, mass-ratios and
+            periods as its columns.
+
+        number : `integer`
+            Number of random binaries in the population.
+
+        seed : `integer`
+            Seed used when the population was generated.
+        """
 
-        self.population_array = np.vstack(
-            (self.primaries, self.mass_ratios, self.periods)
-        ).transpose()
+        pop = cls.__new__(cls)
+        pop.number = int(number)
+        pop.seed = seed
+        pop.population_array = population_array
+        pop.primaries = population_array[:, 0]
+        pop.mass_ratios = population_array[:, 1]
+        pop.periods = population_array[:, 2]
 
-    def generate_primaries(self, args):
+        return pop
+
+    def generate_primaries(self, args, out=None):
         """Method to generate a set of initial primary masses"""
 
         min_mass = float(args["min_mass"])
@@ -119,13 +156,15 @@ class Population(object):
 
         if args["pdf"] == "Salpeter":
             slope = -2.35
-            m1 = sample_from_powerlaw(slope, min_mass, max_mass, self.number)
+            m1 = sample_from_powerlaw(
+                slope, min_mass, max_mass, self.number, out=out
+            )
         else:
             m1 = None
 
         return m1
 
-    def generate_companions(self, args):
+    def generate_companions(self, args, out=None):
         """Method to generate a set of initial mass-ratios
 
         Companion masses are defined as m1 * q
@@ -136,14 +175,14 @@ class Population(object):
 
         if args["pdf"] == "Uniform":
             q = sample_from_uniform(
-                min_mass_ratio, max_mass_ratio, self.number
+                min_mass_ratio, max_mass_ratio, self.number, out=out
             )
         else:
             q = None
 
         return q
 
-    def generate_periods(self, args):
+    def generate_periods(self, args, out=None):
         """Method to generate a set of initial orbital periods"""
 
         min_log_period = np.log10(float(args["min_period"]))
@@ -151,10 +190,12 @@ class Population(object):
 
         if args["pdf"] == "Sana":
             slope = -0.55
-            logp = sample_from_powerlaw(
-                slope, min_log_period, max_log_period, self.number
+            p = sample_from_powerlaw(
+                slope, min_log_period, max_log_period, self.number, out=out
             )
-            p = np.power(10, logp)
+            # the sample is in log10(period); undo the log in place instead
+            # of allocating a second N-sized array
+            np.power(10.0, p, out=p)
         else:
             p = None
 
@@ -244,10 +285,19 @@ class TargetRegion(object):
         zmax = args["zmax"]
         dz = args["dz"]
 
-        x = np.linspace(xmin, xmax, int((xmax - xmin) / dx))
-        y = np.linspace(ymin, ymax, int((ymax - ymin) / dy))
-        z = np.linspace(zmin, zmax, int((zmax - zmin) / dz))
-
-        region = np.array(np.meshgrid(x, y, z)).T.reshape(-1, 3)
+        # dx/dy/dz are step sizes, so build the grids with arange
+        # (linspace's third argument is a number of points, which gave
+        # the wrong spacing here)
+        x = np.arange(xmin, xmax, dx, dtype=np.float64)
+        y = np.arange(ymin, ymax, dy, dtype=np.float64)
+        z = np.arange(zmin, zmax, dz, dtype=np.float64)
+
+        # fill a contiguous (n, 3) array column by column instead of
+        # materializing and transposing a (3, nx, ny, nz) tensor
+        gx, gy, gz = np.meshgrid(x, y, z, indexing="ij", copy=False)
+        region = np.empty((gx.size, 3), dtype=np.float64)
+        region[:, 0] = gx.ravel()
+        region[:, 1] = gy.ravel()
+        region[:, 2] = gz.ravel()
 
         return region
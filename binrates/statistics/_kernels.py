@@ -0,0 +1,68 @@
+"""_kernels
+
+Optional Numba-compiled kernels for the samplers in `rvs`
+
+When Numba is installed, the whole inverse-CDF chain (uniform draw,
+scale, shift, pow) is fused into a single parallel pass over the output
+array: one read, one write, everything else in registers. When it is
+not, `HAS_NUMBA` is False and callers fall back to the NumPy path.
+
+These kernels are for unseeded sampling only: they draw from Numba's
+thread-local RNG, which cannot be seeded across the prange workers, so
+`rvs` routes seeded runs through its Generator-based NumPy path.
+"""
+
+import functools
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit, prange
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+if HAS_NUMBA:
+
+    @functools.lru_cache(maxsize=8)
+    def make_powerlaw_kernel(alpha):
+        """Build a sampling kernel specialized for one powerlaw slope
+
+        The few distinct slopes used here (Salpeter -2.35, Sana -0.55)
+        are fixed per population, so the slope-derived constants are
+        baked into the closure and become compile-time literals for the
+        JIT, leaving a tight multiply-add plus pow loop. Compiled
+        kernels are memoized per slope.
+
+        The returned kernel draws from Numba's thread-local RNG and is
+        therefore not reproducible; callers must only use it for
+        unseeded sampling (see the module docstring).
+
+        Parameters
+        ----------
+        alpha : `float`
+            Slope of the powerlaw function.
+
+        Returns
+        -------
+        kernel : `callable`
+            `kernel(xi, xf, out)` filling `out` with powerlaw draws in
+            one fused parallel pass.
+        """
+
+        expo = alpha + 1.0
+        inv = 1.0 / expo
+
+        @njit(parallel=True, fastmath=True)
+        def kernel(xi, xf, out):
+            pdf_i = xi ** expo
+            scale = xf ** expo - pdf_i
+            for i in prange(out.size):
+                out[i] = (pdf_i + np.random.random() * scale) ** inv
+
+        return kernel
@@ -6,10 +6,24 @@ Module with functions to compute random values from different distributions
 import logging
 
 import numpy as np
-from scipy.stats import uniform
+
+from binrates.statistics import _kernels
 
 logger = logging.getLogger(__name__)
 
+# module-level PCG64 generator used by the samplers; re-seeded via set_seed
+_RNG = np.random.default_rng()
+
+# whether a user seed is active. Seeded sampling must stay on the _RNG
+# NumPy path: the parallel JIT kernels draw from Numba's thread-local
+# RNG, which cannot be seeded across prange workers
+_SEEDED = False
+
+# block size for tiled sampling: ~32k doubles keep the draw and its
+# transforms resident in L2 instead of streaming the full array through
+# the cache once per ufunc pass
+_BLOCK = 1 << 15
+
 
 def set_seed(seed=None):
     """Set a seed for reproduction of results found
@@ -20,15 +34,23 @@ def set_seed(seed=None):
         Number to use for the pseudo-random number generator. Default is None
     """
 
+    global _RNG, _SEEDED
+
     if seed is None:
         logger.warning("seed is None. Return without calling the seed method")
         return
 
-    np.random.seed(seed)
+    _RNG = np.random.default_rng(seed)
+    _SEEDED = True
 
 
 def sample_from_powerlaw(
-    alpha: float = None, xi: float = None, xf: float = None, N: int = 10000
+    alpha: float = None,
+    xi: float = None,
+    xf: float = None,
+    N: int = 10000,
+    out: np.ndarray = None,
+    dtype=np.float64,
 ):
     """Draw a sample of N values distributed according to a powerlaw pdf
 
@@ -48,32 +70,69 @@ def sample_from_powerlaw(
     N : `integer`
         Number of random numbers to sample.
 
+    out : `np.ndarray`
+        Pre-allocated array in which to store the sample. When given, its
+        size and dtype override N and dtype and no new array is allocated
+        for the result.
+
+    dtype : `np.dtype`
+        Floating point type of the sample, either np.float64 (default) or
+        np.float32 (halves memory traffic on large populations).
+
     Returns
     -------
     x : `np.ndarray`
         Array with the drawn values from the powerlaw.
     """
 
-    if not isinstance(alpha, float):
-        raise TypeError("`alpha` must be a float")
-    if not isinstance(xi, float):
-        raise TypeError("`xi` must be a float")
-    if not isinstance(xf, float):
-        raise TypeError("`xf` must be a float")
-    if not isinstance(N, int):
-        raise TypeError("`N` must be an integer")
+    # validation is hoisted to the callers (Population coerces its args
+    # once); keep a cheap guard here that `python -O` strips
+    if __debug__:
+        assert alpha is not None and xi is not None and xf is not None
+
+    if out is not None:
+        N = out.size
+        dtype = out.dtype
+
+    # fused JIT path: single pass over the output, no temporaries; the
+    # kernel is specialized (and memoized) per powerlaw slope. Only
+    # taken while unseeded: the kernel's draws cannot be reproduced, so
+    # seeded runs use the deterministic NumPy path below
+    if _kernels.HAS_NUMBA and not _SEEDED:
+        if out is None:
+            out = np.empty(N, dtype=dtype)
+        kernel = _kernels.make_powerlaw_kernel(float(alpha))
+        kernel(float(xi), float(xf), out)
+        return out
 
     # min & max values
-    pdf_i = np.power(xi, alpha + 1)
-    pdf_f = np.power(xf, alpha + 1)
-
-    # random numbers in the interval (pdf_i, pdf_f)
-    cpd = np.random.uniform(pdf_i, pdf_f, N)
-
-    return np.power(cpd, 1.0 / (alpha + 1))
-
-
-def sample_from_uniform(xi: float = None, xf: float = None, N: int = 10000):
+    pdf_i = xi ** (alpha + 1.0)
+    pdf_f = xf ** (alpha + 1.0)
+    inv = 1.0 / (alpha + 1.0)
+
+    if out is None:
+        out = np.empty(N, dtype=dtype)
+
+    # random numbers in the interval (pdf_i, pdf_f). The scale, shift
+    # and exponentiation run in place on L2-sized blocks, so each block
+    # is read from DRAM once instead of once per ufunc pass
+    for start in range(0, N, _BLOCK):
+        stop = min(start + _BLOCK, N)
+        u = _RNG.random(stop - start, dtype=dtype)
+        u *= pdf_f - pdf_i
+        u += pdf_i
+        np.power(u, inv, out=out[start:stop])
+
+    return out
+
+
+def sample_from_uniform(
+    xi: float = None,
+    xf: float = None,
+    N: int = 10000,
+    out: np.ndarray = None,
+    dtype=np.float64,
+):
     """Draw a sample of N values uniformely distributed
 
     The sample will be constraint between [xi, xf]
@@ -89,23 +148,37 @@ def sample_from_uniform(xi: float = None, xf: float = None, N: int = 10000):
     N : `integer`
         Number of random numbers to sample.
 
+    out : `np.ndarray`
+        Pre-allocated array in which to store the sample. When given, its
+        size and dtype override N and dtype and no new array is allocated
+        for the result.
+
+    dtype : `np.dtype`
+        Floating point type of the sample, either np.float64 (default) or
+        np.float32 (halves memory traffic on large populations).
+
     Returns
     -------
     x : `np.ndarray`
         Array with the drawn values from the uniform pdf.
     """
 
-    if not isinstance(xi, float):
-        raise TypeError("`xi` must be a float")
-    if not isinstance(xf, float):
-        raise TypeError("`xf` must be a float")
-    if not isinstance(N, int):
-        raise TypeError("`N` must be an integer")
-
-    # first, draw random values in the [0, 1] interval
-    u = uniform.rvs(size=N)
-
-    # convert to proper range [xi, xf]
-    x = xi + u * (xf - xi)
-
-    return x
+    # validation is hoisted to the callers (Population coerces its args
+    # once); keep a cheap guard here that `python -O` strips
+    if __debug__:
+        assert xi is not None and xf is not None
+
+    # draw raw uniforms at the requested precision and shift them into
+    # [xi, xf] in place; the Generator call goes straight to numpy's C
+    # implementation without the scipy.stats frozen-distribution
+    # dispatch overhead
+    if out is None:
+        out = _RNG.random(N, dtype=dtype)
+        out *= xf - xi
+        out += xi
+        return out
+
+    u = _RNG.random(out.size, dtype=out.dtype)
+    np.multiply(u, xf - xi, out=out)
+    out += xi
+    return out
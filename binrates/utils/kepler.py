@@ -4,16 +4,55 @@
 from typing import Union
 
 import numpy as np
-from binrates.utils import constants as const
+from binrates.utils import _kepler_jit
 
+try:
+    # numexpr fuses the whole expression into one multi-threaded SIMD
+    # pass over memory, with no intermediate arrays
+    import numexpr as ne
 
-__all_ = ["P_to_a", "a_to_P", "a_to_f"]
+    HAS_NUMEXPR = True
+except ImportError:
+    HAS_NUMEXPR = False
+
+# below this size the numexpr setup cost outweighs the fused pass
+_NUMEXPR_MIN_SIZE = 1 << 13
+
+# fused Kepler's-law constants, computed once at import in _kepler_jit;
+# Python does not fold constants across calls, so evaluating them per
+# call costs several scalar multiplies in every Monte-Carlo iteration
+_P_TO_A_C = _kepler_jit._P_TO_A_C
+_A_TO_P_C = _kepler_jit._A_TO_P_C
+_A_TO_F_C = _kepler_jit._A_TO_F_C
+
+
+__all_ = ["P_to_a", "a_to_P", "a_to_f", "P_to_a_batch", "a_to_P_batch"]
+
+
+def _all_contig_f64(*arrays) -> bool:
+    """Whether all inputs are equal-size 1-D contiguous float64 arrays"""
+
+    first = arrays[0]
+    if not isinstance(first, np.ndarray):
+        return False
+    for a in arrays:
+        if (
+            not isinstance(a, np.ndarray)
+            or a.ndim != 1
+            or a.dtype != np.float64
+            or not a.flags.c_contiguous
+            or a.size != first.size
+        ):
+            return False
+    return True
 
 
 def P_to_a(
     period: Union[float, np.ndarray],
     m1: Union[float, np.ndarray],
     m2: Union[float, np.ndarray],
+    out: np.ndarray = None,
+    dtype=np.float64,
 ) -> Union[float, np.ndarray]:
     """Binary separation from a known period
 
@@ -28,28 +67,84 @@ def P_to_a(
     m2 : `flota/array`
        Mass of secondary star in Msun
 
+    out : `array`
+       Optional pre-allocated array for the result; when given, the
+       whole computation runs in place inside it with no temporaries.
+
+    dtype : `np.dtype`
+       Floating point type of the computation, either np.float64
+       (default) or np.float32, which halves memory bandwidth at the
+       cost of ~7 significant digits of precision.
+
     Returns
     -------
     a : `float/array`
        Binary separation in Rsun
     """
 
-    period = period * 24e0 * 3600e0  # in sec
-    m1 = m1 * const.Msun
-    m2 = m2 * const.Msun  # in g
+    # single precision halves the bandwidth of large-array conversions;
+    # cast once here and numpy keeps the whole pipeline in float32
+    if np.dtype(dtype) == np.float32:
+        period = np.asarray(period, dtype=np.float32)
+        m1 = np.asarray(m1, dtype=np.float32)
+        m2 = np.asarray(m2, dtype=np.float32)
 
-    separation = np.power(
-        const.standard_cgrav * (m1 + m2) * np.square(period / (2 * const.pi)),
-        const.one_third,
-    )
+    # compiled scalar fast path: no ndarray allocation or ufunc dispatch
+    if (
+        _kepler_jit.HAS_NUMBA
+        and np.isscalar(period)
+        and np.isscalar(m1)
+        and np.isscalar(m2)
+    ):
+        return _kepler_jit.p_to_a_scalar(float(period), float(m1), float(m2))
+
+    # every unit conversion and 2*pi factor is folded into one module
+    # constant, so the arrays only see two multiplies, an add and a
+    # cbrt (a dedicated root instruction, much faster than np.power
+    # with a 1/3 exponent)
+    C = _P_TO_A_C
+
+    # compiled array fast path: one fused, multi-threaded pass
+    if (
+        _kepler_jit.HAS_NUMBA
+        and _all_contig_f64(period, m1, m2)
+        and out is None
+    ):
+        out = np.empty(period.size)
+        _kepler_jit.p_to_a_fill(period, m1, m2, out)
+        return out
+
+    if (
+        HAS_NUMEXPR
+        and isinstance(period, np.ndarray)
+        and period.dtype == np.float64
+        and period.size >= _NUMEXPR_MIN_SIZE
+        and out is None
+    ):
+        return ne.evaluate(
+            "(C * (m1 + m2) * period * period) ** (1.0 / 3.0)",
+            local_dict={"C": C, "period": period, "m1": m1, "m2": m2},
+        )
+
+    if out is None:
+        return np.cbrt(C * (m1 + m2) * (period * period))
 
-    return separation / const.Rsun
+    # compute entirely inside the caller's buffer; peak memory is the
+    # output array alone
+    np.add(m1, m2, out=out)
+    out *= C
+    out *= period
+    out *= period
+    np.cbrt(out, out=out)
+    return out
 
 
 def a_to_P(
     separation: Union[float, np.ndarray],
     m1: Union[float, np.ndarray],
     m2: Union[float, np.ndarray],
+    out: np.ndarray = None,
+    dtype=np.float64,
 ) -> Union[float, np.ndarray]:
     """Orbital period from a known separation
 
@@ -64,32 +159,84 @@ def a_to_P(
     m2: `float/array`
        Mass of secondary star in Msun
 
+    out : `array`
+       Optional pre-allocated array for the result; when given, the
+       whole computation runs in place inside it with no temporaries.
+
+    dtype : `np.dtype`
+       Floating point type of the computation, either np.float64
+       (default) or np.float32, which halves memory bandwidth at the
+       cost of ~7 significant digits of precision.
+
     Returns
     -------
     P : `float/array`
        Binary period in days
     """
 
-    separation = separation * const.Rsun  # in cm
-    m1 = m1 * const.Msun
-    m2 = m2 * const.Msun  # in g
+    # single precision halves the bandwidth of large-array conversions;
+    # cast once here and numpy keeps the whole pipeline in float32
+    if np.dtype(dtype) == np.float32:
+        separation = np.asarray(separation, dtype=np.float32)
+        m1 = np.asarray(m1, dtype=np.float32)
+        m2 = np.asarray(m2, dtype=np.float32)
 
-    period = np.power(
-        separation
-        * separation
-        * separation
-        / (const.standard_cgrav * (m1 + m2)),
-        0.5e0,
-    )
-    period = (2 * const.pi) * period
+    # compiled scalar fast path: no ndarray allocation or ufunc dispatch
+    if (
+        _kepler_jit.HAS_NUMBA
+        and np.isscalar(separation)
+        and np.isscalar(m1)
+        and np.isscalar(m2)
+    ):
+        return _kepler_jit.a_to_p_scalar(
+            float(separation), float(m1), float(m2)
+        )
+
+    # every unit conversion and 2*pi factor is folded into one module
+    # constant; only the cube, the mass sum and a sqrt touch the arrays
+    C = _A_TO_P_C
+
+    # compiled array fast path: one fused, multi-threaded pass
+    if (
+        _kepler_jit.HAS_NUMBA
+        and _all_contig_f64(separation, m1, m2)
+        and out is None
+    ):
+        out = np.empty(separation.size)
+        _kepler_jit.a_to_p_fill(separation, m1, m2, out)
+        return out
+
+    if (
+        HAS_NUMEXPR
+        and isinstance(separation, np.ndarray)
+        and separation.dtype == np.float64
+        and separation.size >= _NUMEXPR_MIN_SIZE
+        and out is None
+    ):
+        return ne.evaluate(
+            "sqrt(C * separation ** 3 / (m1 + m2))",
+            local_dict={"C": C, "separation": separation, "m1": m1, "m2": m2},
+        )
+
+    if out is None:
+        return np.sqrt(C * separation * separation * separation / (m1 + m2))
 
-    return period / (24e0 * 3600e0)
+    # compute entirely inside the caller's buffer; the mass sum is the
+    # only temporary
+    np.multiply(separation, separation, out=out)
+    out *= separation
+    out *= C
+    out /= m1 + m2
+    np.sqrt(out, out=out)
+    return out
 
 
 def a_to_f(
     separation: Union[float, np.ndarray],
     m1: Union[float, np.ndarray],
     m2: Union[float, np.ndarray],
+    out: np.ndarray = None,
+    dtype=np.float64,
 ) -> Union[float, np.ndarray]:
     """Converts semi-major axis to orbital frequency
 
@@ -104,18 +251,141 @@ def a_to_f(
     m2 : `float/array`
        Secondary mass
 
+    out : `array`
+       Optional pre-allocated array for the result; when given, the
+       whole computation runs in place inside it with no temporaries.
+
+    dtype : `np.dtype`
+       Floating point type of the computation, either np.float64
+       (default) or np.float32, which halves memory bandwidth at the
+       cost of ~7 significant digits of precision.
+
     Returns
     -------
     f_orb : `float/array`
        Orbital frequency
     """
 
-    separation = separation * const.Rsun  # in cm
-    m1 = m1 * const.Msun
-    m2 = m2 * const.Msun  # in g
+    # single precision halves the bandwidth of large-array conversions;
+    # cast once here and numpy keeps the whole pipeline in float32
+    if np.dtype(dtype) == np.float32:
+        separation = np.asarray(separation, dtype=np.float32)
+        m1 = np.asarray(m1, dtype=np.float32)
+        m2 = np.asarray(m2, dtype=np.float32)
+
+    # compiled scalar fast path: no ndarray allocation or ufunc dispatch
+    if (
+        _kepler_jit.HAS_NUMBA
+        and np.isscalar(separation)
+        and np.isscalar(m1)
+        and np.isscalar(m2)
+    ):
+        return _kepler_jit.a_to_f_scalar(
+            float(separation), float(m1), float(m2)
+        )
+
+    # every unit conversion and 2*pi factor is folded into one module
+    # constant; only the cube, the mass sum and a sqrt touch the arrays
+    C = _A_TO_F_C
+
+    # compiled array fast path: one fused, multi-threaded pass
+    if (
+        _kepler_jit.HAS_NUMBA
+        and _all_contig_f64(separation, m1, m2)
+        and out is None
+    ):
+        out = np.empty(separation.size)
+        _kepler_jit.a_to_f_fill(separation, m1, m2, out)
+        return out
+
+    if (
+        HAS_NUMEXPR
+        and isinstance(separation, np.ndarray)
+        and separation.dtype == np.float64
+        and separation.size >= _NUMEXPR_MIN_SIZE
+        and out is None
+    ):
+        return ne.evaluate(
+            "sqrt(C * (m1 + m2) / separation ** 3)",
+            local_dict={"C": C, "separation": separation, "m1": m1, "m2": m2},
+        )
+
+    if out is None:
+        return np.sqrt(C * (m1 + m2) / (separation * separation * separation))
 
-    f_orb = np.power(
-        const.standard_cgrav * (m1 + m2) / separation ** 3, 0.5
-    ) / (2 * const.pi)
+    # compute entirely inside the caller's buffer; dividing by the
+    # separation three times trades two extra passes for zero
+    # temporaries
+    np.add(m1, m2, out=out)
+    out *= C
+    out /= separation
+    out /= separation
+    out /= separation
+    np.sqrt(out, out=out)
+    return out
 
-    return f_orb
+
+def P_to_a_batch(
+    period: np.ndarray, m1: np.ndarray, m2: np.ndarray
+) -> np.ndarray:
+    """Binary separations for a whole batch of (P, m1, m2) samples
+
+    Prefer this over calling `P_to_a` per sample inside a Monte-Carlo
+    loop: stacking the samples into 1-D arrays amortizes the ufunc
+    dispatch over the entire batch in one fused expression.
+
+    Parameters
+    ----------
+    period : `array`
+       Binary periods in days
+
+    m1 : `array`
+       Masses of the primary stars in Msun
+
+    m2 : `array`
+       Masses of the secondary stars in Msun
+
+    Returns
+    -------
+    a : `array`
+       Binary separations in Rsun
+    """
+
+    return P_to_a(
+        np.asarray(period, dtype=np.float64),
+        np.asarray(m1, dtype=np.float64),
+        np.asarray(m2, dtype=np.float64),
+    )
+
+
+def a_to_P_batch(
+    separation: np.ndarray, m1: np.ndarray, m2: np.ndarray
+) -> np.ndarray:
+    """Orbital periods for a whole batch of (a, m1, m2) samples
+
+    Prefer this over calling `a_to_P` per sample inside a Monte-Carlo
+    loop: stacking the samples into 1-D arrays amortizes the ufunc
+    dispatch over the entire batch in one fused expression.
+
+    Parameters
+    ----------
+    separation : `array`
+       Binary separations in Rsun
+
+    m1 : `array`
+       Masses of the primary stars in Msun
+
+    m2 : `array`
+       Masses of the secondary stars in Msun
+
+    Returns
+    -------
+    P : `array`
+       Binary periods in days
+    """
+
+    return a_to_P(
+        np.asarray(separation, dtype=np.float64),
+        np.asarray(m1, dtype=np.float64),
+        np.asarray(m2, dtype=np.float64),
+    )
@@ -1,12 +1,59 @@
 """A collection of miscellaneous utility functions for plotting stuff
 """
 
-import matplotlib.pyplot as plt
-import seaborn as sns
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+# valid keyword arguments per disttype, precomputed once instead of
+# testing dict membership in a Python loop on every call
+HIST_KEYS = frozenset(
+    (
+        "bins",
+        "range",
+        "density",
+        "cumulative",
+        "bottom",
+        "histtype",
+        "align",
+        "orientation",
+        "rwidth",
+        "log",
+        "label",
+    )
+)
+KDE_KEYS = frozenset(
+    (
+        "gridsize",
+        "cut",
+        "clip",
+        "legend",
+        "cumulative",
+        "bw_method",
+        "bw_adjust",
+        "log_scale",
+        "fill",
+        "label",
+        "linewidth",
+        "linestyle",
+    )
+)
+ECDF_KEYS = frozenset(
+    (
+        "stat",
+        "complementary",
+        "log_scale",
+        "legend",
+        "label",
+        "linewidth",
+        "linestyle",
+    )
+)
 
-# set the default font and fontsize
-plt.rc("font", family="STIXGeneral")
-plt.rcParams["text.usetex"] = False
+# default font and fontsize parameters, applied lazily: importing
+# matplotlib (and seaborn) can take over a second, which code that only
+# wants the constants in this package should not pay for
 params = {
     "figure.figsize": (12, 8),
     "font.style": "normal",
@@ -28,7 +75,35 @@ params = {
     "ytick.direction": "inout",
     "ytick.minor.visible": True,
 }
-plt.rcParams.update(params)
+
+_CONFIGURED = False
+
+
+def configure_mpl_defaults():
+    """Import matplotlib.pyplot and apply the package plot style
+
+    Called by the plotting helpers on first use; returns the pyplot
+    module. The style is only applied once.
+    """
+
+    global _CONFIGURED
+
+    import matplotlib
+
+    # headless environments (no DISPLAY) get the non-interactive Agg
+    # backend so figure rendering never blocks on a GUI event loop
+    if not _CONFIGURED and not os.environ.get("DISPLAY"):
+        matplotlib.use("Agg")
+
+    import matplotlib.pyplot as plt
+
+    if not _CONFIGURED:
+        plt.rc("font", family="STIXGeneral")
+        plt.rcParams["text.usetex"] = False
+        plt.rcParams.update(params)
+        _CONFIGURED = True
+
+    return plt
 
 
 __all_ = ["plot_1D_distribution", "make_scatter_plot"]
@@ -45,7 +120,8 @@ def plot_1D_distribution(
     xlim=None,
     ylim=None,
     color=None,
-    show=True,
+    show=False,
+    savefig=None,
     **kwargs
 ):
     """plot a 1D distribution of ``x``
@@ -95,7 +171,12 @@ def plot_1D_distribution(
         to specify a colour
 
     show : `boolean`
-        Whether to immediately show the plot or only return the Figure and Axis
+        Whether to immediately show the plot or only return the Figure and
+        Axis. Default is False, since showing blocks on the GUI event loop
+        when plotting in a reporting loop
+
+    savefig : `string`
+        Path in which to save the figure, passed to Figure.savefig()
 
     **kwargs : `(if disttype=='hist')`
         Include values for any of `bins, range, density, cumulative, bottom,
@@ -121,6 +202,8 @@ def plot_1D_distribution(
         The axis on which the distribution is plotted
     """
 
+    plt = configure_mpl_defaults()
+
     # create new figure and axes is either weren't provided
     if fig is None or ax is None:
         fig, ax = plt.subplots()
@@ -168,45 +251,57 @@ def plot_1D_distribution(
     }
 
     # set which ones we are using for this plot
-    plot_args = (
-        hist_args
+    plot_args, valid_keys = (
+        (hist_args, HIST_KEYS)
         if disttype == "hist"
-        else kde_args
+        else (kde_args, KDE_KEYS)
         if disttype == "kde"
-        else ecdf_args
+        else (ecdf_args, ECDF_KEYS)
     )
 
     # update the values with those supplied
-    for key, value in kwargs.items():
-        if key in plot_args:
-            plot_args[key] = value
-        else:
-            # warn user if they give an invalid kwarg
-            print(
-                "Warning: keyword argument `{}`".format(key),
-                "not recognised for disttype `{}`".format(disttype),
-                "and will be ignored",
-            )
-
-    # create whichever plot was requested
+    plot_args.update({k: v for k, v in kwargs.items() if k in valid_keys})
+
+    # warn user if they give invalid kwargs
+    rejected = kwargs.keys() - valid_keys
+    if rejected:
+        logger.warning(
+            "keyword argument(s) `%s` not recognised for disttype `%s` "
+            "and will be ignored",
+            ", ".join(sorted(rejected)),
+            disttype,
+        )
+
+    # create whichever plot was requested; seaborn is only imported for
+    # the plot types that need it
     if disttype == "hist":
         ax.hist(x, weights=weights, color=color, **plot_args)
     elif disttype == "kde":
+        import seaborn as sns
+
         sns.kdeplot(x=x, weights=weights, ax=ax, color=color, **plot_args)
     elif disttype == "ecdf":
+        import seaborn as sns
+
         sns.ecdfplot(x=x, weights=weights, ax=ax, color=color, **plot_args)
 
-    # update axis labels
-    if xlabel is not None:
-        ax.set_xlabel(xlabel)
-    if ylabel is not None:
-        ax.set_ylabel(ylabel)
+    # batch the label and limit updates into a single Axes.set call
+    settings = {
+        key: value
+        for key, value in (
+            ("xlabel", xlabel),
+            ("ylabel", ylabel),
+            ("xlim", xlim),
+            ("ylim", ylim),
+        )
+        if value is not None
+    }
+    if settings:
+        ax.set(**settings)
 
-    # update axis limits
-    if xlim is not None:
-        ax.set_xlim(xlim)
-    if ylim is not None:
-        ax.set_ylim(ylim)
+    # save the figure if a path was given
+    if savefig is not None:
+        fig.savefig(savefig)
 
     # immediately show the plot if requested
     if show:
@@ -228,7 +323,8 @@ def make_scatter_plot(
     s=None,
     color=None,
     marker=None,
-    show=True,
+    show=False,
+    savefig=None,
     xlogscale=True,
     ylogscale=False,
     **kwargs
@@ -278,7 +374,12 @@ def make_scatter_plot(
         marker styles.
 
     show : `boolean`
-        Whether to immediately show the plot or only return the Figure and Axis
+        Whether to immediately show the plot or only return the Figure and
+        Axis. Default is False, since showing blocks on the GUI event loop
+        when plotting in a reporting loop
+
+    savefig : `string`
+        Path in which to save the figure, passed to Figure.savefig()
 
     xlogscale : `boolean`
         Whether to use log scale on the xaxis
@@ -298,29 +399,39 @@ def make_scatter_plot(
         The axis on which the distribution is plotted
     """
 
+    plt = configure_mpl_defaults()
+
     # create new figure and axes is either weren't provided
     if fig is None or ax is None:
         fig, ax = plt.subplots()
 
-    if xlogscale:
+    # skip the scale change (and its artist invalidation) when the axis
+    # is already logarithmic, as with a reused Axes in a plotting loop
+    if xlogscale and ax.get_xscale() != "log":
         ax.set_xscale("log")
-    if ylogscale:
+    if ylogscale and ax.get_yscale() != "log":
         ax.set_yscale("log")
 
     # create scatter plot
     ax.scatter(x, y, s=s, c=color, marker=marker, **kwargs)
 
-    # update axis labels
-    if xlabel is not None:
-        ax.set_xlabel(xlabel)
-    if ylabel is not None:
-        ax.set_ylabel(ylabel)
-
-    # update axis limits
-    if xlim is not None:
-        ax.set_xlim(xlim)
-    if ylim is not None:
-        ax.set_ylim(ylim)
+    # batch the label and limit updates into a single Axes.set call
+    settings = {
+        key: value
+        for key, value in (
+            ("xlabel", xlabel),
+            ("ylabel", ylabel),
+            ("xlim", xlim),
+            ("ylim", ylim),
+        )
+        if value is not None
+    }
+    if settings:
+        ax.set(**settings)
+
+    # save the figure if a path was given
+    if savefig is not None:
+        fig.savefig(savefig)
 
     # immediately show the plot if requested
     if show: